@@ -16,7 +16,6 @@ Todo
 __version__ = "0.0.1"
 import abc
 import builtins
-import copy
 import dataclasses
 import functools
 import inspect
@@ -30,6 +29,11 @@ import wtypes
 
 ValidationError = jsonschema.ValidationError
 
+_FORMAT_CHECKER = jsonschema.draft7_format_checker
+_META_VALIDATOR = jsonschema.Draft7Validator(
+    jsonschema.Draft7Validator.META_SCHEMA, format_checker=_FORMAT_CHECKER
+)
+
 
 class _Implementation:
     """An implementation of the pluggy wtypes spec.
@@ -41,22 +45,19 @@ The implementation needs to be registered with the plugin manager.
 
     @wtypes.implementation
     def validate_type(type):
-        jsonschema.validate(
-            _get_schema_from_typeish(type),
-            jsonschema.Draft7Validator.META_SCHEMA,
-            format_checker=jsonschema.draft7_format_checker,
-        )
+        _validate_meta_schema(_get_schema_from_typeish(type))
         return True
 
     @wtypes.implementation
     def validate_object(object, schema):
-        validate = munch.Munch.fromDict(schema)
+        validate, validator = schema, None
         if dataclasses.is_dataclass(object):
             object = vars(object)
         if isinstance(schema, type):
             if hasattr(schema, "_schema"):
                 if isinstance(schema._schema, dict):
                     validate = schema._schema
+                    validator = getattr(schema, "_validator", None)
         if "properties" in validate:
             annotations = getattr(schema, "__annotations__", {})
             for property in list(validate["properties"]):
@@ -76,22 +77,126 @@ The implementation needs to be registered with the plugin manager.
                     else:
                         wtypes.validate_generic(thing, target)
 
-            validate = {
-                **validate,
-                "properties": {
-                    **validate["properties"],
-                    **{x: {} for x in validate["properties"]},
-                },
-            }
-        jsonschema.validate(
-            object, validate, format_checker=jsonschema.draft7_format_checker
-        )
+            if validator is None:
+                validate = _strip_properties(validate)
+        if validator is None:
+            jsonschema.validate(object, validate, format_checker=_FORMAT_CHECKER)
+        else:
+            validator.validate(object)
         return True
 
 
 wtypes.manager.register(_Implementation)
 
 
+def _freeze(value):
+    """A hashable token of a json value that keeps the types of its containers."""
+    if isinstance(value, dict):
+        return dict, frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(map(_freeze, value))
+    hash(value)
+    return type(value), value
+
+
+def _thaw(token):
+    """The json value of a token made by ``_freeze``."""
+    kind, value = token
+    if kind is dict:
+        return {k: _thaw(v) for k, v in value}
+    if kind in (list, tuple):
+        return kind(map(_thaw, value))
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_keyword(key, token):
+    """Validate one frozen keyword against the meta schema."""
+    _META_VALIDATOR.validate({key: _thaw(token)})
+
+
+def _validate_meta_schema(schema):
+    """Validate a schema against the meta schema.
+
+Notes
+-----
+The draft 7 meta schema validates each keyword on its own,
+so keywords that were valid before are not validated again.
+"""
+    fresh = {}
+    for key, value in schema.items():
+        try:
+            token = _freeze(value)
+        except TypeError:
+            # the value is not hashable, it is always validated.
+            fresh[key] = value
+            continue
+        _validate_keyword(key, token)
+    fresh and _META_VALIDATOR.validate(fresh)
+
+
+_compile_pattern = functools.lru_cache(maxsize=1024)(re.compile)
+
+
+def _compile_patterns(schema):
+    """Compile the patterns in a schema when the type is created."""
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            if key == "pattern" and isinstance(value, str):
+                _compile_pattern(value)
+            else:
+                _compile_patterns(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            _compile_patterns(value)
+
+
+def _pattern(validator, pattern, instance, schema):
+    """The pattern keyword using the compiled patterns."""
+    if validator.is_type(instance, "string"):
+        if not _compile_pattern(pattern).search(instance):
+            yield ValidationError(f"{instance!r} does not match {pattern!r}")
+
+
+_Validator = jsonschema.validators.extend(
+    jsonschema.Draft7Validator, {"pattern": _pattern}
+)
+
+
+def _additional_key(key, object):
+    raise ValidationError(f"Additional key {key} not allowed.")
+
+
+_EXTRA_KEYWORDS = (
+    "properties",
+    "patternProperties",
+    "additionalProperties",
+    "propertyNames",
+)
+
+
+def _extra_key(validator, key, object):
+    """Validate a key that is not a property against the schema of the extra keys."""
+    validator.validate({key: object})
+
+
+def _merge_schema(schema, current):
+    """Merge the top level of a schema into another, lists extend and dicts update."""
+    for k, v in current.items():
+        if isinstance(v, list):
+            schema[k] = schema.get(k, []) + v
+        elif isinstance(v, dict):
+            schema[k] = {**schema.get(k, {}), **v}
+        else:
+            schema[k] = v
+    return schema
+
+
+def _strip_properties(schema):
+    """Replace the property schema with empty schema, annotations validate the properties."""
+    return {**schema, "properties": {x: {} for x in schema["properties"]}}
+
+
 def istype(object, cls):
     """instance(object, type) and issubclass(object, cls)
     
@@ -110,10 +215,14 @@ Examples
 class _NoTitle:
     """A subclass suppresses the class name when combining schema"""
 
+    __slots__ = ()
+
 
 class _NoInit:
     """A subclass to restrict initializing an object from the type."""
 
+    __slots__ = ()
+
     def __new__(cls, *args, **kwargs):
         raise TypeError(f"Cannot initialize the type : {cls.__name__}")
 
@@ -143,6 +252,9 @@ A context type cannot be verified as it only describes, althrough some descripto
     _schema = None
     _context = None
     _type = None
+    _validator = None
+    _extra_validator = None
+    _is_valid = None
 
     def __new__(cls, name, base, kwargs, **schema):
 
@@ -156,11 +268,71 @@ A context type cannot be verified as it only describes, althrough some descripto
         if "keywords" in schema:
             kwargs.update({"_type_kwargs": schema.pop("keywords")})
         cls = super().__new__(cls, name, base, kwargs)
-        cls._merge_context(), cls._merge_annotations(), cls._merge_types(), cls._merge_schema(), cls._merge_args()
+        cls._merge_context(), cls._merge_types(), cls._merge(), cls._merge_args()
         if isinstance(cls._schema, dict):
             wtypes.manager.hook.validate_type(type=cls)
+        cls._compile_validator()
         return cls
 
+    def _compile_validator(cls):
+        """Compile the jsonschema validator once for the type.
+
+Notes
+-----
+The annotations validate the properties so they are left out of the compiled validator.
+"""
+        cls._validator, cls._prop_validators, cls._is_valid = None, {}, None
+        cls._extra_validator = None
+        if isinstance(cls._schema, dict):
+            schema = cls._schema
+            if "properties" in schema:
+                schema = _strip_properties(schema)
+            _compile_patterns(schema)
+            cls._validator = _Validator(schema, format_checker=_FORMAT_CHECKER)
+            if (
+                isinstance(schema.get("additionalProperties", None), dict)
+                or "patternProperties" in schema
+                or "propertyNames" in schema
+            ):
+                # The keys that are not properties are validated by these keywords.
+                extra = {k: schema[k] for k in _EXTRA_KEYWORDS if k in schema}
+                cls._extra_validator = _Validator(extra, format_checker=_FORMAT_CHECKER)
+            if getattr(cls.validate, "__func__", None) in _HOOK_VALIDATES:
+                # Only a type validated by the hook may be checked by its validator.
+                cls._is_valid = cls._validator.is_valid
+
+    def _property_validator(cls, key):
+        """The cached validation of one property of the type.
+
+Notes
+-----
+Annotations take precedence over the property schema,
+keys that are not properties share the validation of the empty annotation.
+"""
+        if key in cls._prop_validators:
+            return cls._prop_validators[key]
+        properties = cls._schema.get("properties", {})
+        if key not in properties:
+            if not cls._schema.get("additionalProperties", True):
+                return functools.partial(_additional_key, key)
+            if key not in cls.__annotations__:
+                if "" in cls.__annotations__:
+                    return cls._property_validator("")
+                if cls._extra_validator is not None:
+                    return functools.partial(_extra_key, cls._extra_validator, key)
+                return None
+        target = cls.__annotations__.get(key, cls.__annotations__.get("", None))
+        if target is None:
+            validator = _Validator(properties[key], format_checker=_FORMAT_CHECKER)
+            validator = validator.validate
+        elif hasattr(target, "validate"):
+            # The types with a validate method give the detailed schema errors.
+            validator = target.validate
+        else:
+            validator = functools.partial(wtypes.validate_generic, cls=target)
+        cls._prop_validators[key] = validator
+        return validator
+
     def _merge_args(cls):
         args, kwargs = [], {}
         for object in reversed(cls.__mro__):
@@ -178,42 +350,37 @@ A context type cannot be verified as it only describes, althrough some descripto
             context.update(munch.Munch.fromDict(getattr(self, "_context", {}) or {}))
         cls._context = context or None
 
-    def _merge_annotations(cls):
-        """Merge annotations from the module resolution order."""
-        cls.__annotations__ = getattr(cls, "__annotations__", {})
-        for module in reversed(type(cls).__mro__):
-            cls.__annotations__.update(getattr(module, "__annotations__", {}))
+    def _merge(cls):
+        """Merge annotations and schema from the module resolution order at once.
 
-    def _merge_schema(cls):
-        """Merge schema from the module resolution order."""
-        schema = munch.Munch()
-        types = list()
+Notes
+-----
+The schema a class defines is kept as ``_own_schema``, only the own schema of the
+bases are merged so their lists are not extended again by every subclass.
+"""
+        cls._own_schema = cls.__dict__.get("_schema", None)
+        annotations, schemas = {}, []
         for self in reversed(cls.__mro__):
+            annotations.update(getattr(self, "__annotations__", None) or {})
             py_types = getattr(self, "_type", None)
-            for self in (py_types and (py_types,) or tuple()) + (self,):
-                current = getattr(self, "_schema", {})
-                if isinstance(current, dict):
-                    for k, v in current.items():
-                        if k in {"type", "not", "oneOf", "anyOf", "allOf", "enum"}:
-                            if not (dict({k: v}) in types):
-                                types.append(dict({k: v}))
-                        if isinstance(v, list):
-                            if k not in schema:
-                                schema[k] = list()
-                            schema[k] += v
-                        elif isinstance(v, dict):
-                            if k not in schema:
-                                schema[k] = dict()
-                            schema[k].update(v)
-                        else:
-                            schema[k] = v
-
+            current = getattr(py_types, "__dict__", {}).get("_schema", None)
+            if isinstance(current, dict):
+                schemas.append(current)
+            # Only the classes that define a schema contribute to the merge.
+            own = getattr(self, "__dict__", {})
+            current = own.get("_own_schema", own.get("_schema", None))
+            if isinstance(current, dict):
+                schemas.append(current)
+        schema = functools.reduce(_merge_schema, schemas, {})
+
+        cls.__annotations__ = annotations
         if "required" in schema:
             # Make required a unique list.
             schema["required"] = list(set(schema["required"]))
         if "properties" in schema:
-            schema.properties.pop("", None)
-        cls._schema = schema
+            schema["properties"].pop("", None)
+        # Only the top level is a Munch, the nested schema are plain dicts.
+        cls._schema = munch.Munch(schema)
 
     def _merge_types(cls):
         """Merge schema from the module resolution order."""
@@ -248,6 +415,16 @@ A context type cannot be verified as it only describes, althrough some descripto
         wtypes.manager.hook.validate_object(object=object, schema=cls)
 
     def __instancecheck__(cls, object):
+        if (
+            cls._is_valid is not None
+            and not dataclasses.is_dataclass(object)
+            and _default_validation()
+        ):
+            # The compiled validator answers without building errors.
+            if not cls._is_valid(object):
+                return False
+            if "properties" not in cls._schema:
+                return True
         try:
             cls.validate(object)
             return True
@@ -342,6 +519,28 @@ _schema : dict
         """OneOf the conditions"""
         return wtypes.combining_types.AnyOf[cls, object]
 
+    def __new__(cls, name, base, kwargs, **schema):
+        cls = super().__new__(cls, name, base, kwargs, **schema)
+        cls._specialize_new()
+        return cls
+
+    def _specialize_new(cls):
+        """Choose the constructor of the objects once for the type.
+
+Notes
+-----
+Only the types that inherit the ``Trait`` constructor are specialized.
+"""
+        if "__new__" in vars(cls) or cls.__new__ not in _TRAIT_NEWS:
+            return
+        cls._new_fast = cls._is_valid is not None and "properties" not in cls._schema
+        if dataclasses.is_dataclass(cls):
+            cls.__new__ = staticmethod(_new_dataclass)
+        elif isinstance(cls, _ConstType):
+            cls.__new__ = staticmethod(_new_const)
+        else:
+            cls.__new__ = staticmethod(_new_default)
+
     def validate(cls, object):
         """Validate an object against type's schema.
         
@@ -365,6 +564,25 @@ jsonschema.ValidationError
         wtypes.manager.hook.validate_object(object=object, schema=cls)
 
 
+_HOOK_VALIDATES = _ContextMeta.validate, _SchemaMeta.validate
+
+
+@functools.lru_cache(maxsize=None)
+def _default_validation():
+    """Is the default implementation the only object validation hook?
+
+Notes
+-----
+The answer is cached until a plugin is registered or unregistered.
+"""
+    impls = wtypes.manager.hook.validate_object.get_hookimpls()
+    return len(impls) == 1 and impls[0].plugin is _Implementation
+
+
+wtypes.manager.caches.append(_default_validation)
+_TRAIT_NEWS = set()
+
+
 class _ConstType(_SchemaMeta):
     """ConstType permits bracketed syntax for defining complex types.
             
@@ -376,81 +594,42 @@ The bracketed notebook should differeniate actions on types versus those on obje
     def __getitem__(cls, object):
         if isinstance(object, tuple):
             object = list(object)
-        return type(cls.__name__, (cls,), {}, **{_lower_key(cls.__name__): object})
+        return cls.create(cls.__name__, **{_lower_key(cls.__name__): object})
 
 
 class _ContainerType(_ConstType):
     """ContainerType extras schema from bracketed arguments to define complex types."""
 
     def __getitem__(cls, object):
-        schema_key = _lower_key(cls.__name__)
-        schema = munch.Munch()
-        if isinstance(object, dict):
-            schema.update(_get_schema_from_typeish(object))
+        if isinstance(object, (list, tuple)):
+            schema = [value for value in map(_get_schema_from_typeish, object) if value]
         else:
-            if isinstance(object, (list, tuple)):
-                schema = [
-                    value for value in map(_get_schema_from_typeish, object) if value
-                ]
-            else:
-                schema = _get_schema_from_typeish(object)
-        return cls + Trait.create(schema_key, **{schema_key: schema})
+            schema = _get_schema_from_typeish(object)
+        return cls.create(cls.__name__, **{_lower_key(cls.__name__): schema})
+
+
+_PYTHON_TO_WTYPE = {}
 
 
 def _python_to_wtype(object):
-    if isinstance(object, typing.Hashable):
-        if object == str:
-            object = String
-        elif object == tuple:
-            object = List
-        elif object == list:
-            object = List
-        elif object == dict:
-            object = Dict
-        elif object == int:
-            object = Integer
-        elif object == tuple:
-            object = Tuple
-        elif object == float:
-            object = Float
-        elif object == builtins.object:
-            object = Trait
-        elif object == None:
-            object = None
-        elif object == bool:
-            object = Bool
-        elif object == set:
-            object = Unique
-    return object
+    try:
+        return _PYTHON_TO_WTYPE.get(object, object)
+    except TypeError:
+        # unhashable objects are not python types.
+        return object
 
 
 def _get_schema_from_typeish(object, key="anyOf"):
     """infer a schema from an object."""
     if isinstance(object, typing._GenericAlias):
-        # This is a typing union.
-        if object.__origin__ is typing.Union:
-            return munch.Munch.fromDict(
-                {
-                    key: list(
-                        filter(bool, map(_get_schema_from_typeish, object.__args__))
-                    )
-                }
-            )
-        if object.__origin__ is tuple:
-            return _get_schema_from_typeish(Tuple[object.__args__])
-
-        if object.__origin__ is list:
-            return _get_schema_from_typeish(List[object.__args__])
-
-        if object.__origin__ is dict:
-            return munch.Munch.fromDict(
-                dict(additionalProperties=_get_schema_from_typeish(object.__args__[1]))
-            )
+        try:
+            return _get_schema_from_generic(object, key)
+        except TypeError:
+            # a generic alias with unhashable arguments can't be cached.
+            return _get_schema_from_generic.__wrapped__(object, key)
 
     if isinstance(object, dict):
-        return munch.Munch.fromDict(
-            {k: _get_schema_from_typeish(v) for k, v in object.items()}
-        )
+        return {k: _get_schema_from_typeish(v) for k, v in object.items()}
     if isinstance(object, (list, tuple)):
         return list(map(_get_schema_from_typeish, object))
     object = _python_to_wtype(object)
@@ -459,6 +638,29 @@ def _get_schema_from_typeish(object, key="anyOf"):
     return {}
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_schema_from_generic(object, key):
+    """infer a schema from a typing generic alias.
+
+Notes
+-----
+The schema are cached, they should not be mutated.
+"""
+    # This is a typing union.
+    if object.__origin__ is typing.Union:
+        return {key: list(filter(bool, map(_get_schema_from_typeish, object.__args__)))}
+    if object.__origin__ is tuple:
+        return _get_schema_from_typeish(Tuple[object.__args__])
+
+    if object.__origin__ is list:
+        return _get_schema_from_typeish(List[object.__args__])
+
+    if object.__origin__ is dict:
+        return dict(additionalProperties=_get_schema_from_typeish(object.__args__[1]))
+    return {}
+
+
+@functools.lru_cache(maxsize=None)
 def _lower_key(str):
     return (str[0].lower() + str[1:]).replace("-", "")
 
@@ -496,6 +698,8 @@ class Trait(metaclass=_SchemaMeta):
     """A trait is an object validated by a validate ``jsonschema``.
     """
 
+    __slots__ = ()
+
     _schema = None
     _context = None
 
@@ -540,7 +744,7 @@ object
     def _resolve_defaults(cls, *args, **kwargs) -> tuple:
         if not args and not kwargs:
             if "default" in cls._schema:
-                return (cls._schema.default,)
+                return (cls._schema["default"],)
             elif "properties" in cls._schema:
                 defaults = {}
                 for k, v in cls._schema["properties"].items():
@@ -559,6 +763,40 @@ object
         return args
 
 
+def _new_dataclass(cls, *args, **kwargs):
+    self = super(Trait, cls).__new__(cls)
+    self.__init__(*args, **kwargs)
+    cls.validate(self)
+    return self
+
+
+def _new_const(cls, *args, **kwargs):
+    if not args:
+        return _new_default(cls, *args, **kwargs)
+    wtypes.validate_generic(args[0], getattr(cls, "_type", cls))
+    current_type = type(args[0])
+    candidate_type = _python_to_wtype(current_type)
+    if candidate_type is not current_type:
+        return candidate_type(args[0])
+    return args[0]
+
+
+def _new_default(cls, *args, **kwargs):
+    if dataclasses.is_dataclass(cls):
+        # The type was made a dataclass after it was created.
+        return _new_dataclass(cls, *args, **kwargs)
+    if not args and not kwargs:
+        args = cls._resolve_defaults()
+    if args and cls._new_fast and _default_validation():
+        cls._validator.validate(*args)
+    elif args:
+        cls.validate(*args)
+    return super(Trait, cls).__new__(cls, *args, **kwargs)
+
+
+_TRAIT_NEWS.update((Trait.__new__, _new_dataclass, _new_const, _new_default))
+
+
 def get_jawn(thing, key, object):
     if isinstance(thing, typing.Mapping):
         return thing.get(key, object)
@@ -715,6 +953,8 @@ Examples
     
     """
 
+    __slots__ = ()
+
 
 class Float(Trait, float, metaclass=_NumericSchema, type="number"):
     """float type
@@ -742,6 +982,8 @@ Multiples
     
     """
 
+    __slots__ = ("__weakref__",)
+
 
 class MultipleOf(_NoInit, Trait, metaclass=_ConstType):
     """A multipleof constraint for numeric types."""
@@ -798,17 +1040,25 @@ Examples
 class _Object(metaclass=_ObjectSchema, type="object"):
     """Base class for validating object types."""
 
+    __slots__ = ()
+
     def __init_subclass__(cls, **schema):
-        cls._schema = munch.Munch.fromDict(cls._schema or {})
-        for key, value in cls.__annotations__.items():
-            cls._schema["properties"] = (
-                cls._schema.get("properties", None) or munch.Munch()
-            )
-            cls._schema["properties"][key] = _get_schema_from_typeish(value)
+        # Only copy the levels that are updated, the rest of the schema is shared.
+        cls._schema = munch.Munch(cls._schema or {})
+        if cls.__annotations__:
+            properties = cls._schema["properties"] = {
+                **(cls._schema.get("properties", None) or {}),
+                **{
+                    key: _get_schema_from_typeish(value)
+                    for key, value in cls.__annotations__.items()
+                },
+            }
+        for key in cls.__annotations__:
             if hasattr(cls, key) and not isinstance(
                 getattr(cls, key), dataclasses.Field
             ):
-                cls._schema.properties[key]["default"] = getattr(cls, key)
+                # Copy the property schema, it may belong to another type.
+                properties[key] = {**properties[key], "default": getattr(cls, key)}
 
     @classmethod
     def from_config_file(cls, *object):
@@ -847,6 +1097,8 @@ Examples
     https://json-schema.org/understanding-json-schema/reference/object.html
     """
 
+    __slots__ = ("__weakref__",)
+
     def __new__(cls, *args, **kwargs):
         default = cls._resolve_defaults()
         if default:
@@ -860,38 +1112,18 @@ Examples
 
     def __setitem__(self, key, object):
         """Only test the key being set to avoid invalid state."""
-        if not self._schema.get("additionalProperties", True):
-            if key not in self._schema.get("properties", {}):
-                raise ValidationError(f"Additional key {key} not allowed.")
-        cls = self.__annotations__.get(
-            key,
-            self.__annotations__.get("", self._schema.get("properties", {}).get(key)),
-        )
-        wtypes.validate_generic(object, cls)
+        validate = type(self)._property_validator(key)
+        if validate is not None:
+            validate(object)
         super().__setitem__(key, object)
 
     def update(self, *args, **kwargs):
-        args = (dict(*args, **kwargs),)
-        tmp = type(
-            "tmp",
-            (Dict,),
-            {
-                "__annotations__": {
-                    key: self.__annotations__.get(
-                        key,
-                        type(
-                            "tmp",
-                            (Trait,),
-                            {},
-                            **self._schema.get("properties", {}).get(key, {}),
-                        ),
-                    )
-                    for key in args[0]
-                }
-            },
-        )
-        wtypes.manager.hook.validate_object(object=args[0], schema=tmp)
-        super().update(*args, **kwargs)
+        args = dict(*args, **kwargs)
+        for key, value in args.items():
+            validate = type(self)._property_validator(key)
+            if validate is not None:
+                validate(value)
+        super().update(args)
 
 
 class Bunch(Dict, munch.Munch):
@@ -985,6 +1217,8 @@ String constraints
     >>> assert not isinstance('a'*100, (2<String)<10)
     """
 
+    __slots__ = ("__weakref__",)
+
 
 class MinLength(Trait, _NoInit, _NoTitle, metaclass=_ConstType):
     """Minimum length of a string type."""
@@ -1092,8 +1326,21 @@ Tuple
     >>> assert List[Integer, String]([1, 'abc', 2])
     >>> assert isinstance([1, '1'], List[Integer, String])
     >>> assert not isinstance([1, {}], List[Integer, String])
+
+Extending from an iterable
+
+    >>> l = Unique[Integer]([1])
+    >>> l.extend(x for x in range(2, 4))
+    >>> l.extend(range(3, 10))
+    Traceback (most recent call last):
+    ...
+    jsonschema.exceptions.ValidationError: ...
+    >>> l
+    [1, 2, 3]
     """
 
+    __slots__ = ("__weakref__",)
+
     def __new__(cls, *args, **kwargs):
         args = cls._resolve_defaults(*args) or ([],)
 
@@ -1155,14 +1402,14 @@ Tuple
             raise e
 
     def extend(self, object):
-        id = slice(len(self), len(self) + len(object))
-        self._verify_item(object, id)
+        object, start = list(object), len(self)
+        self._verify_item(object, slice(start, start + len(object)))
         super().extend(object)
         try:
             type(self).validate(self)
         except ValidationError as e:
-            for i in range(len(object)):
-                self.pop(-1)
+            # Remove the new tail at once, pop validates the list each time.
+            del self[start:]
             raise e
 
     def pop(self, index=-1):
@@ -1188,6 +1435,8 @@ Examples
     
     """
 
+    __slots__ = ()
+
 
 class Tuple(List):
     """tuple type
@@ -1212,6 +1461,8 @@ Examples
     
     """
 
+    __slots__ = ()
+
 
 class UniqueItems(Trait, _NoInit, _NoTitle, metaclass=_ConstType):
     """Schema for unique items in a list."""
@@ -1276,3 +1527,18 @@ class Then(Trait, _NoInit, _NoTitle, metaclass=_ContainerType):
 
 class Else(Trait, _NoInit, _NoTitle, metaclass=_ContainerType):
     """else condition type"""
+
+
+_PYTHON_TO_WTYPE.update(
+    {
+        str: String,
+        tuple: Tuple,
+        list: List,
+        dict: Dict,
+        int: Integer,
+        float: Float,
+        builtins.object: Trait,
+        bool: Bool,
+        set: Unique,
+    }
+)
@@ -10,19 +10,8 @@ import wtypes
 class Setter:
     def __setattr__(self, key, object):
         """Only test the attribute being set to avoid invalid state."""
-        for k in (key, ""):
-            if key in self.__annotations__:
-                cls = self.__annotations__[key]
-                break
-
-        else:
-            return builtins.object.__setattr__(self, key, object)
-
-        if hasattr(cls, "validate"):
-            cls.validate(object)
-        else:
-            wtypes.validate_generic(object, cls)
-
+        if key in self.__annotations__:
+            type(self)._property_validator(key)(object)
         builtins.object.__setattr__(self, key, object)
 
 
@@ -46,10 +35,7 @@ Examples
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__()
         dataclasses.dataclass(cls)
-        required = []
-        for key in cls.__annotations__:
-            if not hasattr(cls, key):
-                required.append(key)
+        required = [key for key in cls.__annotations__ if not hasattr(cls, key)]
         if required:
             cls._schema["required"] = list(
                 set(cls._schema.get("required", []) + required)
@@ -10,13 +10,36 @@ import contextlib
 import functools
 import inspect
 import typing
+import weakref
 
 import wtypes
 
+_empty = inspect._empty
+_dict_get = dict.get
+_COPY, _CALL = range(2)
+
+
+class _Obs(typing.NamedTuple):
+    """A link record, the kind is _COPY or _CALL.
+
+The target is a reference that is called for the object, it is weak unless the
+object cannot be weakly referenced. The mapping flag chooses item or attribute
+access on the target.
+"""
+
+    target_id: int
+    target: object
+    to: str
+    kind: int
+    fn: object
+    level: int
+    key_hash: int
+    mapping: bool
+
 
 class spec:
     @wtypes.specification
-    def dlink(this, source, that, target, callable):
+    def dlink(this, source, that, target, callable, level):
         """"""
 
     @wtypes.specification
@@ -24,6 +47,13 @@ class spec:
         """"""
 
 
+def _ref(object):
+    try:
+        return weakref.ref(object)
+    except TypeError:
+        return lambda: object
+
+
 def get_jawn(thing, key, object):
     if isinstance(thing, typing.Mapping):
         return thing.get(key, object)
@@ -47,7 +77,7 @@ class spec_impl:
 
 class wtypes_impl(spec_impl):
     @wtypes.implementation
-    def dlink(this, source, that, target, callable):
+    def dlink(this, source, that, target, callable, level):
         if (
             isinstance(target, str)
             and hasattr(that, target)
@@ -57,17 +87,7 @@ class wtypes_impl(spec_impl):
             set_jawn(that, target, get_jawn(this, source, None))
         if issubclass(type(this), wtypes.Trait):
             if issubclass(type(that), wtypes.Trait):
-                this._registered_links = this._registered_links or {}
-                this._registered_id = this._registered_id or {}
-                this._registered_links[source] = this._registered_links.get(source, {})
-                if id(that) not in this._registered_links[source]:
-                    this._registered_links[source][id(that)] = {}
-                if target not in this._registered_links[source][id(that)]:
-                    this._registered_links[source][id(that)][target] = []
-                if id(that) not in this._registered_id:
-                    this._registered_id[id(that)] = that
-                if callable not in this._registered_links[source][id(that)][target]:
-                    this._registered_links[source][id(that)][target].append(callable)
+                this._register_link(source, that, target, callable, level)
                 return this
 
             elif isinstance(that, wtypes.python_types.Instance["ipywidgets.Widget"]):
@@ -100,7 +120,9 @@ wtypes.manager.register(wtypes_impl)
 class Link:
     _registered_parents = None
     _registered_links = None
-    _registered_id = None
+    _self_observers = None
+    _last_key = _empty
+    _last_records = (), ()
     _deferred_changed = None
     _deferred_prior = None
     _depth = 0
@@ -115,16 +137,26 @@ class Link:
             self._propagate()
             self._update_display()
 
-    def link(this, source, that, target="value"):
+    def link(this, source, that, target="value", level=0):
         wtypes.manager.hook.dlink(
-            this=this, source=source, that=that, target=target, callable=None
+            this=this,
+            source=source,
+            that=that,
+            target=target,
+            callable=None,
+            level=level,
         )
         wtypes.manager.hook.dlink(
-            this=that, source=target, that=this, target=source, callable=None
+            this=that,
+            source=target,
+            that=this,
+            target=source,
+            callable=None,
+            level=level,
         )
         return this
 
-    def dlink(self, source, that, target, callable=None):
+    def dlink(self, source, that, target, callable=None, level=0):
         """
         
     Examples
@@ -140,56 +172,182 @@ class Link:
         """
 
         wtypes.manager.hook.dlink(
-            this=self, source=source, that=that, target=target, callable=callable
+            this=self,
+            source=source,
+            that=that,
+            target=target,
+            callable=callable,
+            level=level,
         )
         return self
 
-    def observe(self, source="", callable=None):
-        """The callable has to define a signature."""
-        return self.dlink(source, self, source, callable=callable)
+    def observe(self, source="", callable=None, level=0):
+        """The callable has to define a signature.
+
+    Notes
+    -----
+    Observers only fire for changes notified at their level or above.
+    An inner loop uses level 0 and an outer loop uses level 1, expensive
+    observers are registered at level 1 and are notified once the outer loop
+    is done.
+
+    Examples
+    --------
+        >>> e = Dict().observe('a', print, level=1)
+        >>> e['a'] = 1
+        >>> e.notify('a', level=1)
+        {'new': 1, 'old': None, 'object': {'a': 1}, 'name': 'a'}
+
+        """
+        return self.dlink(source, self, source, callable=callable, level=level)
+
+    def notify(self, *changed, level=0):
+        """Notify the observers of the changed keys up to a level."""
+        self._propagate(*changed, notify_level=level)
 
-    def _propagate(self, *changed, **prior):
-        self._deferred_changed = list(self._deferred_changed or changed)
-        self._deferred_prior = {**prior, **(self._deferred_prior or {})}
+    def _register_link(self, source, that, target, function, level):
+        """Record a link from a source key to a target on another object.
+
+The links of a source are a list of ``_Obs`` records, the kind is ``_CALL`` when
+the value is transformed by the function and ``_COPY`` when it is copied. A link
+to a target replaces the prior link. The observers of the source itself are kept
+apart as ``(function, level)`` pairs, an observer replaces the same observer.
+"""
+        self._last_key = _empty
+        if that is self and target == source:
+            self._self_observers = self._self_observers or {}
+            observers = self._self_observers.get(source, [])
+            observers = [x for x in observers if x[0] != function]
+            observers.append((function, level))
+            self._self_observers[source] = observers
+            return
+        if self._registered_links is None:
+            self._registered_links = {}
+        target_id = id(that)
+        kind = _CALL if callable(function) else _COPY
+        records = self._other_records(source, that, target)
+        # A new list so that a drain iterating the prior records is not affected.
+        records.append(
+            _Obs(
+                target_id,
+                _ref(that),
+                target,
+                kind,
+                function,
+                level,
+                hash((target_id, target)),
+                isinstance(that, typing.Mapping),
+            )
+        )
+        self._registered_links[source] = records
+
+    def _prune_links(self, source):
+        """Drop the records of a source whose targets were garbage collected."""
+        self._last_key = _empty
+        records = self._registered_links.get(source, ())
+        alive = [x for x in records if x.target() is not None]
+        if alive:
+            self._registered_links[source] = alive
+        else:
+            self._registered_links.pop(source, None)
+
+    def _other_records(self, source, that, target):
+        """The records of a source except the link to the target.
+
+Notes
+-----
+The hash of the target id and key is compared first, it fails fast for the
+records of other targets before the identity and key are compared.
+"""
+        target_id = id(that)
+        key_hash = hash((target_id, target))
+        records = (self._registered_links or {}).get(source, [])
+        return [
+            x
+            for x in records
+            if x.key_hash != key_hash or x.target_id != target_id or x.to != target
+        ]
+
+    def _propagate(self, *changed, notify_level=0, prior_map=None):
+        if self._deferred_changed is None:
+            # An insertion ordered dict maps the changed keys to their notify level.
+            self._deferred_changed, self._deferred_prior = {}, {}
+        for key in changed:
+            level = self._deferred_changed.get(key, notify_level)
+            self._deferred_changed[key] = max(level, notify_level)
+        for key, value in (prior_map or {}).items():
+            # The oldest prior value of a key wins.
+            self._deferred_prior.setdefault(key, value)
 
         if self._depth == 0:
+            # The type of self does not change while draining.
+            mapping = isinstance(self, typing.Mapping)
+            # The values are collected per target across all the drained keys.
+            batches, notices = {}, []
             while self._deferred_changed:
-                key = self._deferred_changed.pop(-1)
-                old = (self._deferred_prior or {}).pop(key, None)
-                for hash in (
-                    self._registered_links[key]
-                    if self._registered_links and key in self._registered_links
-                    else []
-                ):
-                    thing = self._registered_id[hash]
-                    for k, v in self._registered_links[key][hash].items():
-                        if k == key and hash == id(self):
-                            for func in v:
-                                func(
-                                    dict(
-                                        new=self.get(key, None)
-                                        if hasattr(self, "get")
-                                        else None,
-                                        old=old,
-                                        object=self,
-                                        name=key,
-                                    )
-                                )
+                key, notify_level = self._deferred_changed.popitem()
+                old = self._deferred_prior.pop(key, None)
+                if key is self._last_key:
+                    # Consecutive changes of a key reuse its records.
+                    observers, records = self._last_records
+                else:
+                    # The links and observers are read for each key, a callback may
+                    # register the first of them while draining.
+                    registered, observed = self._registered_links, self._self_observers
+                    records = registered.get(key, ()) if registered else ()
+                    observers = observed.get(key, ()) if observed else ()
+                    self._last_key, self._last_records = key, (observers, records)
+                if not (observers or records):
+                    continue
+                # The source value is read once for all the callbacks.
+                if mapping:
+                    value = _dict_get(self, key, _empty)
+                else:
+                    value = getattr(self, key, _empty)
+                source = None if value is _empty else value
+                new = source if mapping else None
+                dead = False
+                for _, target, to, kind, function, level, _, setitem in records:
+                    if level > notify_level:
+                        continue
+                    thing = target()
+                    if thing is None:
+                        # The target was garbage collected, its record is pruned.
+                        dead = True
+                        continue
+                    if kind == _CALL:
+                        result = function(source)
+                    else:
+                        if not setitem:
+                            current = getattr(thing, to, None)
+                        elif isinstance(thing, dict):
+                            current = _dict_get(thing, to, None)
                         else:
-                            for to, functions in self._registered_links[key][
-                                hash
-                            ].items():
-                                if functions:
-                                    function = functions[-1]
-                                    if callable(function):
-                                        thing.update({to: function(self[key])})
-                                    else:
-                                        if get_jawn(thing, to, None) is not get_jawn(
-                                            self, key, inspect._empty
-                                        ):
-                                            set_jawn(
-                                                thing, to, get_jawn(self, key, None)
-                                            )
+                            # Other mappings are read through their own get.
+                            current = thing.get(to)
+                        if current is value:
+                            continue
+                        result = source
+                    batches.setdefault(id(thing), (thing, setitem, {}))[2][to] = result
+                dead and self._prune_links(key)
+                for function, level in observers:
+                    if level <= notify_level:
+                        notices.append(
+                            (function, dict(new=new, old=old, object=self, name=key))
+                        )
+            # Each target is written once for all the drained keys.
+            for thing, setitem, batch in batches.values():
+                if setitem and len(batch) > 1:
+                    thing.update(batch)
+                elif setitem:
+                    for to, result in batch.items():
+                        thing[to] = result
+                else:
+                    for to, result in batch.items():
+                        setattr(thing, to, result)
+            # The observers run after the links so they see the linked values.
+            for function, change in notices:
+                function(change)
 
     def _update_display(self):
         if self._display_id:
@@ -231,23 +389,29 @@ class _EventedDict(_EventedObject):
                 self in v._registered_parents or v._registered_parents.append(self)
 
     def __setitem__(self, key, object):
+        prior = _dict_get(self, key, _empty)
+        if prior is object:
+            # Writing the same object is a no-op, it was validated and linked.
+            return
         with self:
-            prior = self.get(key, None)
             super().__setitem__(key, object)
             self._link_parent({key: object})
-            if object is not prior:
-                self._propagate(key, **{key: prior})
+            self._propagate(key, prior_map={key: None if prior is _empty else prior})
 
     def update(self, *args, **kwargs):
+        changed, prior = {}, {}
+        for key, object in dict(*args, **kwargs).items():
+            # Only the keys that change are updated and propagated.
+            current = _dict_get(self, key, _empty)
+            if current is not object:
+                changed[key] = object
+                prior[key] = None if current is _empty else current
+        if not changed:
+            return
         with self:
-            args = dict(*args, **kwargs)
-            prior = {x: self[x] for x in args if x in self}
-            super().update(args)
-            self._link_parent(args)
-            prior = {
-                k: v for k, v in prior.items() if v is not self.get(k, inspect._empty)
-            }
-            self._propagate(*args, **prior)
+            super().update(changed)
+            self._link_parent(changed)
+            self._propagate(*changed, prior_map=prior)
 
 
 class _EventedDataClass(_EventedObject):
@@ -268,7 +432,9 @@ class _EventedDataClass(_EventedObject):
             "_deferred_prior",
             "_registered_parents",
             "_registered_links",
-            "_registered_id",
+            "_self_observers",
+            "_last_key",
+            "_last_records",
             "_display_id",
         }:
             return super().__setattr__(key, object)
@@ -278,7 +444,7 @@ class _EventedDataClass(_EventedObject):
             super().__setattr__(key, object)
             self._link_parent({key: object})
             if object is not prior:
-                self._propagate(key, **{key: prior})
+                self._propagate(key, prior_map={key: prior})
 
 
 class _EventedList(Link):
@@ -328,9 +494,9 @@ class _EventedList(Link):
         with self:
             return super().pop(index)
 
-    def observe(self, callable=None):
+    def observe(self, callable=None, level=0):
         """The callable has to define a signature."""
-        return self.dlink("", self, "", callable=callable)
+        return self.dlink("", self, "", callable=callable, level=level)
 
 
 class List(_EventedList, wtypes.wtypes.List):
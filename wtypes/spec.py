@@ -2,7 +2,33 @@ import pluggy
 
 specification = pluggy.HookspecMarker("wtypes")
 implementation = pluggy.HookimplMarker("wtypes")
-manager = pluggy.PluginManager("wtypes")
+
+
+class _PluginManager(pluggy.PluginManager):
+    """A plugin manager that clears the caches of its hooks when plugins change."""
+
+    def __init__(self, project_name):
+        super().__init__(project_name)
+        self.caches = []
+
+    def register(self, plugin, name=None):
+        try:
+            return super().register(plugin, name)
+        finally:
+            self._clear_caches()
+
+    def unregister(self, plugin=None, name=None):
+        try:
+            return super().unregister(plugin, name)
+        finally:
+            self._clear_caches()
+
+    def _clear_caches(self):
+        for cache in self.caches:
+            cache.cache_clear()
+
+
+manager = _PluginManager("wtypes")
 
 
 class spec:
@@ -6,6 +6,8 @@ import munch
 
 import wtypes
 
+_FORMAT_CHECKER = jsonschema.draft7_format_checker
+
 
 def istype(object, cls):
     """instance(object, type) and issubclass(object, cls)
@@ -23,7 +25,7 @@ Examples
 
 
 def validate_schema(object: object, schema: dict) -> None:
-    validate = munch.Munch.fromDict(schema)
+    validate = schema
     if dataclasses.is_dataclass(object):
         object = vars(object)
     if isinstance(schema, type):
@@ -49,22 +51,14 @@ def validate_schema(object: object, schema: dict) -> None:
                 else:
                     validate_generic(thing, target)
 
-        validate = {
-            **validate,
-            "properties": {
-                **validate["properties"],
-                **{x: {} for x in validate["properties"]},
-            },
-        }
+        validate = {**validate, "properties": {x: {} for x in validate["properties"]}}
     if "items" in validate:
         items = getattr(schema, "__annotations__", {}).get("", validate["items"])
         if isinstance(object, list):
             [validate_generic(x, items) for x in object]
         validate = {**validate, "items": {}}
 
-    jsonschema.validate(
-        object, validate, format_checker=jsonschema.draft7_format_checker
-    )
+    jsonschema.validate(object, validate, format_checker=_FORMAT_CHECKER)
 
 
 def validate_generic(object, cls):